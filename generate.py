@@ -10,6 +10,7 @@ see <https://spdx.org/licenses/MIT-0>.
 """
 
 
+import functools
 import itertools
 import re
 from collections import defaultdict
@@ -71,6 +72,28 @@ CHARACTERS_SIMPLIFIED_TEMPLATE = Template(
     f'$body\n'
 )
 
+CAPTURE_GROUP_REGEX = re.compile(
+    r'\( (?P<alternatives>[1-5|]*) \)',
+    flags=re.VERBOSE,
+)
+
+BACK_REFERENCE_REGEX = re.compile(
+    r'\\ (?P<group_number>[1-9])',
+    flags=re.VERBOSE,
+)
+
+COMPLIANT_LINE_REGEX = re.compile(
+    r'''
+        U[+] (?P<codepoint_hex> [0-9A-F]{4,5} )
+            \t
+        (?P<character> \S ) (?P<character_type> [\^*]? )
+            \t
+        (?P<sequence_regex> [1-5|()\\]+ )
+            \n
+    ''',
+    flags=re.VERBOSE,
+)
+
 
 def supplant_capture_group(match, alternatives_storage):
     """
@@ -84,42 +107,36 @@ def supplant_capture_group(match, alternatives_storage):
     return back_reference
 
 
-def realise_back_reference(match, alternatives_combo):
-    """
-    Replace a back reference with the appropriate alternative.
-    """
-    group_number = int(match.group('group_number'))
-    alternative = alternatives_combo[group_number - 1]
-
-    return alternative
-
-
+@functools.lru_cache(maxsize=None)
 def to_sequence_set(sequence_regex):
     """
-    Convert stroke sequence regex to a stroke sequence set.
+    Convert stroke sequence regex to a (frozen) stroke sequence set.
     Assumes capture groups:
         1. number at most 9,
         2. are not nested,
         3. contain pure digits separated by pipes, and
         4. are referred to by a backslash followed by a positive decimal digit.
     """
+    if sequence_regex.isdigit():  # plain stroke sequence, no groups or back references
+        return frozenset({sequence_regex})
+
     alternatives_storage = []
-    back_reference_template = re.sub(
-        r'\( (?P<alternatives>[1-5|]*) \)',
+    back_reference_template = CAPTURE_GROUP_REGEX.sub(
         lambda match: supplant_capture_group(match, alternatives_storage),
         sequence_regex,
-        flags=re.VERBOSE,
     )
 
-    sequences = {
-        re.sub(
-            r'\\ (?P<group_number>[1-9])',
-            lambda match: realise_back_reference(match, alternatives_combo),
-            back_reference_template,
-            flags=re.VERBOSE,
+    template_fragments = BACK_REFERENCE_REGEX.split(back_reference_template)
+    literals = template_fragments[0::2]
+    group_indices = [int(group_number) - 1 for group_number in template_fragments[1::2]]
+
+    sequences = frozenset(
+        literals[0] + ''.join(
+            alternatives_combo[group_index] + literal
+            for group_index, literal in zip(group_indices, literals[1:])
         )
         for alternatives_combo in itertools.product(*alternatives_storage)
-    }
+    )
 
     return sequences
 
@@ -135,26 +152,17 @@ def main():
         lines = codepoint_character_sequence_file.readlines()
 
     for line in lines:
-        compliant_match = re.fullmatch(
-            r'''
-                U[+] (?P<codepoint_hex> [0-9A-F]{4,5} )
-                    \t
-                (?P<character> \S ) (?P<character_type> [\^*]? )
-                    \t
-                (?P<sequence_regex> [1-5|()\\]+ )
-                    \n
-            ''',
-            line,
-            flags=re.VERBOSE,
-        )
+        compliant_match = COMPLIANT_LINE_REGEX.fullmatch(line)
 
         if not compliant_match:
             continue
 
-        codepoint_hex = compliant_match.group('codepoint_hex')
-        character = compliant_match.group('character')
-        character_type = compliant_match.group('character_type')
-        sequence_regex = compliant_match.group('sequence_regex')
+        codepoint_hex, character, character_type, sequence_regex = compliant_match.group(
+            'codepoint_hex',
+            'character',
+            'character_type',
+            'sequence_regex',
+        )
 
         if int(codepoint_hex, 16) != ord(character):
             continue
@@ -8,6 +8,7 @@ Sort (in-place) certain sections of `phrases-traditional.txt` and `phrases-simpl
 Licensed under "MIT No Attribution" (MIT-0), see <https://spdx.org/licenses/MIT-0>.
 """
 
+import functools
 import re
 
 CJK_UNIFIED_IDEOGRAPHS_START = 0x4E00
@@ -19,12 +20,14 @@ PHRASE_FILE_NAMES = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
 def character_sorting_key(character):
     """
     Return a key for simple sorting of Chinese characters.
 
     Puts characters in the main CJK Unified Ideographs block (U+4E00 to U+9FFF) first,
     but otherwise sorts by code point.
+    Cached, since the same characters recur across many phrases.
     """
     code_point = ord(character)
 